@@ -3,16 +3,31 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
 from .models import AgentsConfig, GameConfig, ModelsConfig
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> dict:
+    # mtime/size are part of the key so an edited file misses the cache.
+    # yaml is imported here so runs that only use defaults never load it.
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as _SafeLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as _SafeLoader
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_SafeLoader)
+    return data or {}
+
+
 class ConfigLoader:
     def __init__(self, config_dir: Optional[str | Path] = None):
         if config_dir is None:
@@ -34,10 +49,8 @@ class ConfigLoader:
             logger.warning("Config file not found: %s, using defaults", filepath)
             return {}
         
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        
-        return data or {}
+        stat = filepath.stat()
+        return _load_yaml_cached(str(filepath.resolve()), stat.st_mtime_ns, stat.st_size)
 
     def load_game_config(self, force_reload: bool = False) -> GameConfig:
         if self._game_config is not None and not force_reload:
@@ -9,15 +9,17 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, field_validator
 
 
+_ENV_VAR_PATTERN = re.compile(r'\$\{(\w+)(?::([^}]*))?\}')
+
+
+def _replace_env_var(match: re.Match) -> str:
+    return os.environ.get(match.group(1), match.group(2) or "")
+
+
 def resolve_env_vars(value: str) -> str:
-    pattern = r'\$\{(\w+)(?::([^}]*))?\}'
-    
-    def replacer(match):
-        var_name = match.group(1)
-        default_value = match.group(2) or ""
-        return os.environ.get(var_name, default_value)
-    
-    return re.sub(pattern, replacer, value)
+    if "${" not in value:
+        return value
+    return _ENV_VAR_PATTERN.sub(_replace_env_var, value)
 
 
 class RagConfig(BaseModel):
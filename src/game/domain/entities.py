@@ -10,12 +10,13 @@ This module defines all core domain entities including:
 
 from __future__ import annotations
 
+import sys
 import uuid
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
 class AgentRole(str, Enum):
@@ -85,6 +86,10 @@ class PlayerProfile(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "PlayerProfile":
+        return cls.model_construct(**data)
+
     def update_preference(self, key: str, value: Any) -> None:
         self.preferences[key] = value
         self.updated_at = datetime.now()
@@ -100,6 +105,15 @@ class SessionEvent(BaseModel):
     raw_tool_calls: Optional[Dict[str, Any]] = None
     verdict: Optional[str] = None
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "SessionEvent":
+        fields = {**data, "role": AgentRole(data["role"])}
+        # Tags come from a tiny vocabulary; share one string per tag across
+        # long histories instead of keeping every copy json decoding makes
+        if fields.get("tags"):
+            fields["tags"] = [sys.intern(tag) for tag in fields["tags"]]
+        return cls.model_construct(**fields)
+
 
 class SessionConfig(BaseModel):
     llm_provider: str = "ollama"
@@ -124,6 +138,40 @@ class GameSession(BaseModel):
     completed_at: Optional[datetime] = None
     schema_version: str = "1.0"
 
+    # Kept in step by append_event; don't append to turn_history directly
+    _question_count: int = PrivateAttr(default=0)
+
+    @model_validator(mode="after")
+    def _init_question_count(self) -> "GameSession":
+        self._recount_questions()
+        return self
+
+    def _recount_questions(self) -> None:
+        self._question_count = sum(
+            1 for event in self.turn_history
+            if "question" in event.tags
+        )
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "GameSession":
+        """Rebuild from our own store's dump (datetimes already decoded), skipping validation.
+
+        Only enums and nested models are rebuilt by hand; use model_validate
+        for anything that did not come out of model_dump.
+        """
+        fields = dict(data)
+        # Missing keys are left for model_construct to fill with field defaults
+        if "state" in fields:
+            fields["state"] = GameState(fields["state"])
+        fields["turn_history"] = [
+            SessionEvent.from_trusted(event) for event in fields.get("turn_history", ())
+        ]
+        if "config" in fields:
+            fields["config"] = SessionConfig.model_construct(**fields["config"])
+        session = cls.model_construct(**fields)
+        session._recount_questions()
+        return session
+
     @property
     def turn_count(self) -> int:
         return len(self.turn_history)
@@ -131,10 +179,7 @@ class GameSession(BaseModel):
     @property
     def question_count(self) -> int:
         """Returns the actual number of questions asked (real turns)."""
-        return sum(
-            1 for event in self.turn_history
-            if "question" in event.tags
-        )
+        return self._question_count
 
     @property
     def is_active(self) -> bool:
@@ -172,9 +217,14 @@ class GameSession(BaseModel):
             message=message,
             tags=tags or [],
         )
+        self.append_event(event)
+        return event
+
+    def append_event(self, event: SessionEvent) -> None:
         self.turn_history.append(event)
+        if "question" in event.tags:
+            self._question_count += 1
         self.updated_at = datetime.now()
-        return event
 
     def get_recent_events(self, limit: int = 10) -> List[SessionEvent]:
         return self.turn_history[-limit:] if self.turn_history else []
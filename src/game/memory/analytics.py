@@ -14,6 +14,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
+import orjson
+
 from game.memory.entities import (
     EventTag,
     MemorySummaryType,
@@ -252,8 +254,20 @@ class AnalyticsService:
         filename: str,
     ) -> Path:
         filepath = self._export_dir / f"{filename}.json"
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        filepath.write_bytes(
+            orjson.dumps(
+                data,
+                default=str,
+                # Hand datetimes and dataclasses to default=str, as json.dump
+                # did, rather than orjson's native ISO/dict encodings
+                option=(
+                    orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_PASSTHROUGH_DATACLASS
+                ),
+            )
+        )
         logger.info("Exported analytics to %s", filepath)
         return filepath
 
@@ -400,42 +414,35 @@ class SessionEventAggregator:
 
         for event_file in events_dir.glob("*.jsonl"):
             session_id = event_file.stem
-            events = []
+            event_count = 0
+            question_count = 0
+            hint_count = 0
+            hypothesis_count = 0
+            has_success = False
 
             try:
-                with open(event_file, "r", encoding="utf-8") as f:
+                with open(event_file, "rb") as f:
                     for line in f:
-                        if line.strip():
-                            event_data = json.loads(line)
-                            events.append(event_data)
+                        if not line.strip():
+                            continue
+                        event = orjson.loads(line)
+                        tags = event.get("tags", [])
+                        event_count += 1
+                        question_count += "question" in tags
+                        hint_count += "hint" in tags
+                        hypothesis_count += "hypothesis" in tags
+                        if not has_success and "final_verdict" in tags:
+                            has_success = "correct" in event.get("message", "").lower()
             except Exception as e:
                 logger.warning("Failed to read event log %s: %s", event_file, e)
                 continue
 
-            if not events:
+            if not event_count:
                 continue
 
-            question_count = sum(
-                1 for e in events
-                if "question" in e.get("tags", [])
-            )
-            hint_count = sum(
-                1 for e in events
-                if "hint" in e.get("tags", [])
-            )
-            hypothesis_count = sum(
-                1 for e in events
-                if "hypothesis" in e.get("tags", [])
-            )
-            has_success = any(
-                "final_verdict" in e.get("tags", [])
-                and "correct" in e.get("message", "").lower()
-                for e in events
-            )
-
             results.append({
                 "session_id": session_id,
-                "event_count": len(events),
+                "event_count": event_count,
                 "question_count": question_count,
                 "hint_count": hint_count,
                 "hypothesis_count": hypothesis_count,
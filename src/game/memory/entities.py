@@ -95,6 +95,10 @@ class MemoryDocument(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "MemoryDocument":
+        return cls.model_construct(**data)
+
     @classmethod
     def from_session_event(cls, event: SessionEventRecord) -> "MemoryDocument":
         return cls(
@@ -6,23 +6,23 @@ storing memory documents as JSON files with simple search capabilities.
 
 from __future__ import annotations
 
-import json
 import logging
+import os
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import orjson
+
 from game.memory.base_store import BaseMemoryStore, MemorySearchResult
 from game.memory.entities import MemoryDocument
 
 logger = logging.getLogger(__name__)
 
-
-class DateTimeEncoder(json.JSONEncoder):
-    def default(self, obj: Any) -> Any:
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+_CREATED_AT_CACHE_SIZE = 10_000
+_SEARCH_CACHE_NAMESPACES = 32
 
 
 def datetime_decoder(dct: Dict[str, Any]) -> Dict[str, Any]:
@@ -36,6 +36,20 @@ def datetime_decoder(dct: Dict[str, Any]) -> Dict[str, Any]:
     return dct
 
 
+def _decode_datetimes(obj: Any) -> Any:
+    # orjson has no object_hook, so apply datetime_decoder to every nested dict
+    if isinstance(obj, dict):
+        for value in obj.values():
+            if isinstance(value, (dict, list)):
+                _decode_datetimes(value)
+        return datetime_decoder(obj)
+    if isinstance(obj, list):
+        for item in obj:
+            if isinstance(item, (dict, list)):
+                _decode_datetimes(item)
+    return obj
+
+
 class FileMemoryStore(BaseMemoryStore):
     def __init__(
         self,
@@ -45,14 +59,36 @@ class FileMemoryStore(BaseMemoryStore):
         self._base_dir = Path(base_dir)
         self._base_dir.mkdir(parents=True, exist_ok=True)
         self._score_fn = score_fn or self._default_score_fn
+        # The WebUI shares one engine, and so this store, across all script
+        # threads; _lock guards the three caches below
+        self._lock = threading.Lock()
+        # Last index append_to_namespace wrote, per (namespace, prefix); a hint only
+        self._append_counters: Dict[Tuple[str, str], int] = {}
+        # search() keeps each namespace's parsed documents and their lowercased
+        # text, keyed by file name and revalidated against (mtime_ns, size);
+        # LRU-bounded by namespace
+        self._search_cache: OrderedDict[
+            str, Dict[str, Tuple[int, int, MemoryDocument, str]]
+        ] = OrderedDict()
+        self._default_scoring = score_fn is None
+        self._namespace_dirs: Dict[str, Path] = {}
+        # created_at of documents this store wrote, with the file's
+        # (mtime_ns, size) at the time, so overwriting one does not have to
+        # read it back first; LRU-bounded
+        self._created_at: OrderedDict[
+            Tuple[str, str], Tuple[datetime, int, int]
+        ] = OrderedDict()
 
     @property
     def base_dir(self) -> Path:
         return self._base_dir
 
     def _namespace_dir(self, namespace: str) -> Path:
-        safe_namespace = namespace.replace(":", "_").replace("/", "_")
-        return self._base_dir / safe_namespace
+        ns_dir = self._namespace_dirs.get(namespace)
+        if ns_dir is None:
+            safe_namespace = namespace.replace(":", "_").replace("/", "_")
+            ns_dir = self._namespace_dirs[namespace] = self._base_dir / safe_namespace
+        return ns_dir
 
     def _document_file(self, namespace: str, key: str) -> Path:
         safe_key = key.replace("/", "_").replace("\\", "_")
@@ -72,9 +108,43 @@ class FileMemoryStore(BaseMemoryStore):
         index: bool = True,
     ) -> MemoryDocument:
         ns = self._normalize_namespace(namespace)
-        self._ensure_namespace_dir(ns)
+        # A direct put may claim a key an append counter would hand out next
+        self._forget_append_counters(ns)
 
-        existing = self.get(ns, key)
+        doc_file = self._document_file(ns, key)
+        created_at = self._known_created_at(ns, key, doc_file)
+        if created_at is None:
+            existing = self._read_document(ns, key, doc_file)
+            created_at = existing.created_at if existing else None
+        return self._write_document(ns, key, value, metadata, created_at)
+
+    def _known_created_at(
+        self, ns: str, key: str, doc_file: Path
+    ) -> Optional[datetime]:
+        # Trust the cached value only while the file is still the one we wrote
+        with self._lock:
+            entry = self._created_at.get((ns, key))
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(doc_file)
+        except FileNotFoundError:
+            stat = None
+        if stat is None or (stat.st_mtime_ns, stat.st_size) != entry[1:]:
+            with self._lock:
+                self._created_at.pop((ns, key), None)
+            return None
+        return entry[0]
+
+    def _write_document(
+        self,
+        ns: str,
+        key: str,
+        value: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]],
+        created_at: Optional[datetime],
+        exclusive: bool = False,
+    ) -> MemoryDocument:
         now = datetime.now()
 
         document = MemoryDocument(
@@ -82,19 +152,39 @@ class FileMemoryStore(BaseMemoryStore):
             key=key,
             value=value,
             metadata=metadata or {},
-            created_at=existing.created_at if existing else now,
+            created_at=created_at or now,
             updated_at=now,
         )
 
+        payload = orjson.dumps(
+            document.model_dump(mode="json"),
+            option=orjson.OPT_INDENT_2,
+        )
         doc_file = self._document_file(ns, key)
-        with open(doc_file, "w", encoding="utf-8") as f:
-            json.dump(
-                document.model_dump(mode="json"),
-                f,
-                cls=DateTimeEncoder,
-                ensure_ascii=False,
-                indent=2,
+        # exclusive raises FileExistsError instead of replacing a document
+        mode = "xb" if exclusive else "wb"
+        try:
+            f = open(doc_file, mode)
+        except FileNotFoundError:
+            # First write into this namespace; create the directory lazily
+            # rather than issuing a mkdir on every put
+            self._ensure_namespace_dir(ns)
+            f = open(doc_file, mode)
+        with f:
+            f.write(payload)
+            f.flush()
+            stat = os.fstat(f.fileno())
+
+        # (mtime_ns, size) can miss a same-size rewrite on coarse-mtime
+        # filesystems, so our own writes drop the search entry outright
+        self._forget_search_entry(ns, doc_file)
+        with self._lock:
+            self._created_at[(ns, key)] = (
+                document.created_at, stat.st_mtime_ns, stat.st_size
             )
+            self._created_at.move_to_end((ns, key))
+            if len(self._created_at) > _CREATED_AT_CACHE_SIZE:
+                self._created_at.popitem(last=False)
 
         logger.debug("Stored document %s/%s", ns, key)
         return document
@@ -105,19 +195,33 @@ class FileMemoryStore(BaseMemoryStore):
         key: str,
     ) -> Optional[MemoryDocument]:
         ns = self._normalize_namespace(namespace)
-        doc_file = self._document_file(ns, key)
-
-        if not doc_file.exists():
-            return None
+        return self._read_document(ns, key, self._document_file(ns, key))
 
+    def _read_document(
+        self, namespace: str, key: str, doc_file: Path
+    ) -> Optional[MemoryDocument]:
         try:
-            with open(doc_file, "r", encoding="utf-8") as f:
-                data = json.load(f, object_hook=datetime_decoder)
-            return MemoryDocument.model_validate(data)
+            with open(doc_file, "rb") as f:
+                data = _decode_datetimes(orjson.loads(f.read()))
+            return MemoryDocument.from_trusted(data)
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            logger.error("Failed to load document %s/%s: %s", ns, key, e)
+            logger.error("Failed to load document %s/%s: %s", namespace, key, e)
             return None
 
+    def batch_get(
+        self,
+        items: List[Tuple[str, str]],
+    ) -> List[Optional[MemoryDocument]]:
+        # _read_document treats a missing file as None, so each key costs one
+        # open attempt and nothing scales with the namespace size
+        documents = []
+        for namespace, key in items:
+            ns = self._normalize_namespace(namespace)
+            documents.append(self._read_document(ns, key, self._document_file(ns, key)))
+        return documents
+
     def delete(
         self,
         namespace: str | Tuple[str, ...],
@@ -126,12 +230,23 @@ class FileMemoryStore(BaseMemoryStore):
         ns = self._normalize_namespace(namespace)
         doc_file = self._document_file(ns, key)
 
-        if doc_file.exists():
+        try:
             doc_file.unlink()
-            logger.debug("Deleted document %s/%s", ns, key)
-            return True
+        except FileNotFoundError:
+            return False
+
+        self._forget_search_entry(ns, doc_file)
+        with self._lock:
+            self._created_at.pop((ns, key), None)
+        self._forget_append_counters(ns)
+        logger.debug("Deleted document %s/%s", ns, key)
+        return True
 
-        return False
+    def _forget_search_entry(self, ns: str, doc_file: Path) -> None:
+        with self._lock:
+            cached = self._search_cache.get(ns)
+            if cached is not None:
+                cached.pop(doc_file.name, None)
 
     def search(
         self,
@@ -141,44 +256,84 @@ class FileMemoryStore(BaseMemoryStore):
         limit: int = 10,
     ) -> List[MemorySearchResult]:
         ns = self._normalize_namespace(namespace)
-        ns_dir = self._namespace_dir(ns)
-
-        if not ns_dir.exists():
-            return []
-
-        results: List[MemorySearchResult] = []
-
-        for doc_file in ns_dir.glob("*.json"):
-            doc = self.get(ns, doc_file.stem)
-            if doc is None:
-                continue
+        query_words = query.lower().split() if query else []
+        scored: List[Tuple[float, MemoryDocument]] = []
 
+        for doc, content in self._scan_namespace(ns):
             if filter and not self._matches_filter(doc, filter):
                 continue
 
-            score = self._score_fn(query, doc.value) if query else 1.0
-            results.append(MemorySearchResult(document=doc, score=score))
+            if not query:
+                score = 1.0
+            elif self._default_scoring:
+                score = self._score_content(query_words, content)
+            else:
+                score = self._score_fn(query, doc.value)
+            scored.append((score, doc))
+
+        scored.sort(key=lambda item: item[0], reverse=True)
+        # Cached documents are shared between calls, so hand out copies
+        return [
+            MemorySearchResult(document=doc.model_copy(deep=True), score=score)
+            for score, doc in scored[:limit]
+        ]
+
+    def _scan_namespace(self, ns: str) -> List[Tuple[MemoryDocument, str]]:
+        ns_dir = self._namespace_dir(ns)
+        with self._lock:
+            cached = dict(self._search_cache.get(ns, {}))
+        fresh: Dict[str, Tuple[int, int, MemoryDocument, str]] = {}
 
-        results.sort(key=lambda r: r.score, reverse=True)
-        return results[:limit]
+        try:
+            with os.scandir(ns_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json") or not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    hit = cached.get(entry.name)
+                    if hit and hit[0] == stat.st_mtime_ns and hit[1] == stat.st_size:
+                        fresh[entry.name] = hit
+                        continue
+                    doc = self._read_document(ns, entry.name[:-5], Path(entry.path))
+                    if doc is not None:
+                        fresh[entry.name] = (
+                            stat.st_mtime_ns,
+                            stat.st_size,
+                            doc,
+                            str(doc.value).lower(),
+                        )
+        except FileNotFoundError:
+            with self._lock:
+                self._search_cache.pop(ns, None)
+            return []
+
+        with self._lock:
+            self._search_cache[ns] = fresh
+            self._search_cache.move_to_end(ns)
+            if len(self._search_cache) > _SEARCH_CACHE_NAMESPACES:
+                self._search_cache.popitem(last=False)
+        return [(doc, content) for _, _, doc, content in fresh.values()]
 
     def list_namespaces(self) -> List[str]:
-        namespaces = []
-        for item in self._base_dir.iterdir():
-            if item.is_dir():
-                ns = item.name.replace("_", ":", 1)
-                namespaces.append(ns)
-        return namespaces
+        with os.scandir(self._base_dir) as entries:
+            return [
+                entry.name.replace("_", ":", 1)
+                for entry in entries
+                if entry.is_dir()
+            ]
 
     def list_keys(self, namespace: str | Tuple[str, ...]) -> List[str]:
         ns = self._normalize_namespace(namespace)
-        ns_dir = self._namespace_dir(ns)
-
-        if not ns_dir.exists():
+        try:
+            with os.scandir(self._namespace_dir(ns)) as entries:
+                return [
+                    entry.name[:-5]
+                    for entry in entries
+                    if entry.name.endswith(".json") and entry.is_file()
+                ]
+        except FileNotFoundError:
             return []
 
-        return [f.stem for f in ns_dir.glob("*.json")]
-
     def _matches_filter(self, doc: MemoryDocument, filter: Dict[str, Any]) -> bool:
         for key, expected_value in filter.items():
             actual_value = doc.metadata.get(key) or doc.value.get(key)
@@ -190,10 +345,10 @@ class FileMemoryStore(BaseMemoryStore):
         if not query:
             return 1.0
 
-        query_lower = query.lower()
-        content = str(value).lower()
+        return self._score_content(query.lower().split(), str(value).lower())
 
-        query_words = query_lower.split()
+    @staticmethod
+    def _score_content(query_words: List[str], content: str) -> float:
         if not query_words:
             return 0.0
 
@@ -221,16 +376,37 @@ class FileMemoryStore(BaseMemoryStore):
         key_prefix: str = "item",
     ) -> MemoryDocument:
         ns = self._normalize_namespace(namespace)
-        existing_keys = self.list_keys(ns)
-
-        max_index = 0
-        for key in existing_keys:
-            if key.startswith(key_prefix + "_"):
-                try:
-                    idx = int(key.split("_")[-1])
-                    max_index = max(max_index, idx)
-                except ValueError:
-                    pass
-
-        new_key = f"{key_prefix}_{max_index + 1}"
-        return self.put(ns, new_key, value, metadata)
+        counter_key = (ns, key_prefix)
+
+        with self._lock:
+            max_index = self._append_counters.get(counter_key)
+        if max_index is None:
+            max_index = 0
+            for key in self.list_keys(ns):
+                if key.startswith(key_prefix + "_"):
+                    try:
+                        idx = int(key.split("_")[-1])
+                        max_index = max(max_index, idx)
+                    except ValueError:
+                        pass
+
+        # The counter is only a hint: another store or process may have taken
+        # the next index, so create exclusively and move on if it exists
+        while True:
+            max_index += 1
+            try:
+                document = self._write_document(
+                    ns, f"{key_prefix}_{max_index}", value, metadata, None,
+                    exclusive=True,
+                )
+            except FileExistsError:
+                continue
+            with self._lock:
+                if self._append_counters.get(counter_key, 0) < max_index:
+                    self._append_counters[counter_key] = max_index
+            return document
+
+    def _forget_append_counters(self, namespace: str) -> None:
+        with self._lock:
+            for counter_key in [k for k in self._append_counters if k[0] == namespace]:
+                del self._append_counters[counter_key]
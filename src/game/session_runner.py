@@ -832,10 +832,7 @@ Your response:"""
         return max(100, base_score - question_penalty - hint_penalty)
 
     def _count_questions(self) -> int:
-        return sum(
-            1 for event in self._session.turn_history
-            if EventTag.QUESTION.value in event.tags
-        )
+        return self._session.question_count
 
     def _get_recent_qa_pairs(self, limit: int = 10, verdict_only: bool = False) -> List[tuple[str, str]]:
         """Get recent question-answer pairs.
@@ -879,8 +876,7 @@ Your response:"""
             tags=[t.value for t in tags],
             verdict=verdict,
         )
-        self._session.turn_history.append(event)
-        self._session.updated_at = datetime.now()
+        self._session.append_event(event)
         self._save_session()
 
         event_record = SessionEventRecord(
@@ -105,7 +105,7 @@ class GameSessionStore:
         with open(session_file, "r", encoding="utf-8") as f:
             data = json.load(f, object_hook=datetime_decoder)
 
-        return GameSession.model_validate(data)
+        return GameSession.from_trusted(data)
 
     def session_exists(self, session_id: str) -> bool:
         return self._session_file(session_id).exists()
@@ -174,7 +174,7 @@ class GameSessionStore:
             for line in f:
                 if line.strip():
                     data = json.loads(line, object_hook=datetime_decoder)
-                    events.append(SessionEvent.model_validate(data))
+                    events.append(SessionEvent.from_trusted(data))
 
         return events
 
@@ -246,7 +246,7 @@ class PlayerProfileStore:
         with open(profile_file, "r", encoding="utf-8") as f:
             data = json.load(f, object_hook=datetime_decoder)
 
-        return PlayerProfile.model_validate(data)
+        return PlayerProfile.from_trusted(data)
 
     def profile_exists(self, player_id: str) -> bool:
         return self._profile_file(player_id).exists()
@@ -14,30 +14,25 @@ from webui.components import render_css, render_error
 from webui.home import render_home_page
 from webui.game import render_game_page
 from webui.async_utils import run_async
+from webui.engines import load_game_engine
 
-_engine_ready_printed = False
+_LANGUAGES = get_available_languages()
+_LANGUAGE_LABELS = list(_LANGUAGES.values())
+_LANGUAGE_INDEX = {lang: index for index, lang in enumerate(_LANGUAGES)}
+_LABEL_TO_LANGUAGE = {label: lang for lang, label in _LANGUAGES.items()}
 
 
 def init_game_engine():
-    global _engine_ready_printed
-    if state.get_game_engine() is None:
-        try:
-            from game.engine import GameEngine
-            engine = GameEngine()
-            state.set_game_engine(engine)
-            
-            if not _engine_ready_printed:
-                print("\n" + "=" * 50)
-                print("🎮 Game engine initialized successfully!")
-                print("🌐 WebUI is ready at: http://localhost:8501")
-                print("=" * 50 + "\n")
-                _engine_ready_printed = True
-            
-            return True
-        except Exception as e:
-            state.set_error_message(f"Failed to initialize game engine: {str(e)}")
-            return False
-    return True
+    try:
+        load_game_engine()
+        return True
+    except Exception as e:
+        state.set_error_message(f"Failed to initialize game engine: {str(e)}")
+        return False
+
+
+def _on_language_change() -> None:
+    state.set_language(_LABEL_TO_LANGUAGE[st.session_state.sidebar_lang_select])
 
 
 def render_sidebar(i18n: I18n) -> None:
@@ -47,32 +42,23 @@ def render_sidebar(i18n: I18n) -> None:
         
         st.markdown("---")
         
-        languages = get_available_languages()
-        lang_options = list(languages.keys())
-        lang_labels = list(languages.values())
-        current_lang = i18n.language
-        current_index = lang_options.index(current_lang) if current_lang in lang_options else 0
-        
-        new_lang_label = st.selectbox(
+        st.selectbox(
             i18n("sidebar_language"),
-            options=lang_labels,
-            index=current_index,
+            options=_LANGUAGE_LABELS,
+            index=_LANGUAGE_INDEX.get(i18n.language, 0),
             key="sidebar_lang_select",
+            on_change=_on_language_change,
         )
-        new_lang = lang_options[lang_labels.index(new_lang_label)]
-        
-        if new_lang != current_lang:
-            state.set_language(new_lang)
-            st.rerun()
         
+        current_player_id = state.get_player_id()
         player_id = st.text_input(
             i18n("sidebar_player_id"),
-            value=state.get_player_id(),
+            value=current_player_id,
             key="sidebar_player_input",
             help=i18n("sidebar_player_id_help"),
         )
         
-        if player_id != state.get_player_id():
+        if player_id != current_player_id:
             state.set_player_id(player_id)
         
         ui_settings = state.get_ui_settings()
@@ -82,9 +68,8 @@ def render_sidebar(i18n: I18n) -> None:
             key="sidebar_agent_mode",
             help=i18n("settings_player_agent_mode_help"),
         )
-        if player_agent_mode != ui_settings.player_agent_mode:
-            ui_settings.player_agent_mode = player_agent_mode
-            state.set_ui_settings(ui_settings)
+        # ui_settings is the live session-state object; mutate it in place
+        ui_settings.player_agent_mode = player_agent_mode
         
         st.markdown("---")
         
@@ -5,94 +5,122 @@ which runs in a synchronous context but needs to call async code.
 
 The key issue is that creating and closing event loops repeatedly
 causes problems with libraries like LightRAG that maintain async state
-(connections, queues, etc.) across calls.
+(connections, queues, etc.) across calls. Coroutines are therefore
+submitted to a single long-lived event loop running in a daemon thread,
+fully decoupled from the Streamlit script thread.
 """
 
 import asyncio
 import threading
+from concurrent.futures import Future
 from typing import TypeVar, Coroutine, Any
 
 T = TypeVar('T')
 
 # Global event loop management
 _loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
 _loop_lock = threading.Lock()
 
 
+def _start_loop() -> asyncio.AbstractEventLoop:
+    """Create a new event loop and run it forever in a daemon thread."""
+    global _loop, _loop_thread
+
+    _loop = asyncio.new_event_loop()
+    _loop_thread = threading.Thread(
+        target=_loop.run_forever,
+        name="webui-event-loop",
+        daemon=True,
+    )
+    _loop_thread.start()
+    return _loop
+
+
 def get_event_loop() -> asyncio.AbstractEventLoop:
-    """Get or create a shared event loop for async operations.
-    
+    """Get the shared background event loop for async operations.
+
     This ensures we reuse the same event loop across all async calls,
     preventing 'Event loop is closed' errors from libraries that
-    maintain async state.
+    maintain async state. The loop is restarted if it was cleaned up.
     """
-    global _loop
-    
     with _loop_lock:
         if _loop is None or _loop.is_closed():
-            _loop = asyncio.new_event_loop()
+            return _start_loop()
         return _loop
 
 
+def submit_async(coro: Coroutine[Any, Any, T]) -> "Future[T]":
+    """Schedule a coroutine on the shared background loop without waiting.
+
+    Several coroutines may be in flight at once; they all share the one
+    loop and its async state.
+
+    Args:
+        coro: The coroutine to execute
+
+    Returns:
+        A concurrent.futures.Future resolving to the coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+
+
 def run_async(coro: Coroutine[Any, Any, T]) -> T:
     """Safely run an async coroutine from synchronous code.
-    
-    This function:
-    1. Uses a shared event loop instead of creating new ones
-    2. Does NOT close the loop after execution
-    3. Handles nested event loop scenarios
-    
+
+    The coroutine is scheduled on the shared background loop and the
+    calling thread blocks until it completes. The loop is never closed
+    after execution, so async state survives between calls.
+
     Args:
         coro: The coroutine to execute
-        
+
     Returns:
         The result of the coroutine
-        
+
     Raises:
+        RuntimeError: If called from the background loop thread itself
         Any exception raised by the coroutine
     """
-    loop = get_event_loop()
-    
-    # Check if we're already in an async context
-    try:
-        running_loop = asyncio.get_running_loop()
-        if running_loop is loop:
-            # We're inside the same loop - create a task
-            import nest_asyncio
-            nest_asyncio.apply()
-            return loop.run_until_complete(coro)
-    except RuntimeError:
-        # No running loop - this is the normal case
-        pass
-    
-    # Set the loop and run
-    asyncio.set_event_loop(loop)
-    return loop.run_until_complete(coro)
+    if threading.current_thread() is _loop_thread:
+        coro.close()
+        raise RuntimeError("run_async cannot be called from the event loop thread")
+
+    return submit_async(coro).result()
+
+
+async def _cancel_pending_tasks() -> None:
+    current = asyncio.current_task()
+    pending = [task for task in asyncio.all_tasks() if task is not current]
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
 
 
 def cleanup_event_loop() -> None:
     """Clean up the shared event loop.
-    
+
     Call this when the application is shutting down.
     """
-    global _loop
-    
+    global _loop, _loop_thread
+
     with _loop_lock:
         if _loop is not None and not _loop.is_closed():
             try:
-                # Cancel all pending tasks
-                pending = asyncio.all_tasks(_loop)
-                for task in pending:
-                    task.cancel()
-                
-                # Run until all tasks are cancelled
-                if pending:
-                    _loop.run_until_complete(
-                        asyncio.gather(*pending, return_exceptions=True)
-                    )
-                
+                # Cancel all pending tasks, then stop the loop thread
+                asyncio.run_coroutine_threadsafe(
+                    _cancel_pending_tasks(), _loop
+                ).result()
+                _loop.call_soon_threadsafe(_loop.stop)
+                if _loop_thread is not None:
+                    _loop_thread.join()
                 _loop.close()
             except Exception:
                 pass  # Ignore cleanup errors
             finally:
                 _loop = None
+                _loop_thread = None
+
+
+_start_loop()
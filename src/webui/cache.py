@@ -0,0 +1,46 @@
+"""Cached engine reads for the WebUI.
+
+Streamlit replays the whole script on every widget interaction, so reads
+that hit the session store or puzzle repository are memoized here. The
+engine argument is underscore-prefixed so Streamlit does not hash it.
+Session reads are invalidated only by ``version``, which callers pass as
+``session_state.get_state_version()``; the cache is shared by the whole
+process, but versions are unique per browser session, so a state change
+there invalidates only its own reads. Stale versions are never read again
+and age out through ``max_entries``. The puzzle list does not depend on
+session state and is invalidated only by its TTL.
+"""
+
+from typing import List, NamedTuple, Optional
+
+import streamlit as st
+
+from game.domain.entities import GameState, PuzzleSummary
+
+
+class SessionRow(NamedTuple):
+    """The slice of a GameSession the session lists actually render."""
+
+    session_id: str
+    puzzle_id: str
+    state_value: str
+    question_count: int
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_list_puzzles(_engine) -> List[PuzzleSummary]:
+    return _engine.list_puzzles()
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def cached_list_sessions(
+    _engine,
+    player_id: str,
+    state_value: Optional[str] = None,
+    version: int = 0,
+) -> List[SessionRow]:
+    state_filter = GameState(state_value) if state_value else None
+    return [
+        SessionRow(s.session_id, s.puzzle_id, s.state.value, s.question_count)
+        for s in _engine.list_sessions(state_filter=state_filter, player_id=player_id)
+    ]
@@ -1,14 +1,38 @@
 """Reusable UI components for the WebUI."""
 
-from typing import Optional, List
+import html
+from typing import Optional, List, Tuple
 import streamlit as st
 
-from webui.config import EMOJI_MAP, CSS_STYLES
+from webui.config import EMOJI_MAP, CSS_STYLES_MIN, ChatMessage
 from webui.i18n import I18n
 
+_STATUS_TEMPLATE = '<span class="status-badge status-{css}">{{label}}</span>'
+_STATUS_HTML = {
+    key: _STATUS_TEMPLATE.format(css=key.replace("_", "-"))
+    for key in ("lobby", "in_progress", "completed", "aborted")
+}
+
+# role -> (CSS role, avatar) for the chat history renderer
+_PLAYER_ROLE = ("user", EMOJI_MAP["player"])
+_DM_ROLE = ("assistant", EMOJI_MAP["dm"])
+_ROLE_MAP = {
+    "player": _PLAYER_ROLE,
+    "user": _PLAYER_ROLE,
+    "you": _PLAYER_ROLE,
+    "dm": _DM_ROLE,
+    "assistant": _DM_ROLE,
+}
+
+_VERDICT_TEMPLATE = '<span class="verdict-badge verdict-{css}">{emoji} {label}</span>'
+_VERDICT_HTML = {
+    key: _VERDICT_TEMPLATE.format(css=key.replace("_", "-"), emoji=EMOJI_MAP[key], label=key.upper())
+    for key in ("yes", "no", "yes_and_no", "irrelevant", "correct", "partial", "incorrect")
+}
+
 
 def render_css() -> None:
-    st.markdown(CSS_STYLES, unsafe_allow_html=True)
+    st.markdown(CSS_STYLES_MIN, unsafe_allow_html=True)
 
 
 def render_header(i18n: I18n) -> None:
@@ -99,57 +123,77 @@ def render_game_stats(
 
 def render_status_badge(state: str, i18n: I18n) -> str:
     state_lower = state.lower().replace(" ", "_")
-    state_key = f"state_{state_lower}"
-    state_display = i18n(state_key)
-    
-    css_class = f"status-{state_lower.replace('_', '-')}"
-    
-    return f'<span class="status-badge {css_class}">{state_display}</span>'
+    template = _STATUS_HTML.get(state_lower)
+    if template is None:
+        template = _STATUS_TEMPLATE.format(css=state_lower.replace("_", "-"))
+    return template.format(label=i18n(f"state_{state_lower}"))
 
 
-def render_chat_message(
-    role: str,
-    content: str,
-    verdict: Optional[str] = None,
-    i18n: Optional[I18n] = None,
-) -> None:
-    if role.lower() in ["player", "user", "you"]:
-        avatar = EMOJI_MAP["player"]
-        name = i18n("game_you") if i18n else "You"
-    else:
-        avatar = EMOJI_MAP["dm"]
-        name = i18n("game_dm") if i18n else "DM"
-    
-    with st.chat_message(role.lower() if role.lower() in ["user", "assistant"] else "user" if role.lower() == "player" else "assistant", avatar=avatar):
-        if verdict:
-            verdict_emoji = EMOJI_MAP.get(verdict.lower(), "")
-            st.markdown(f"**{name}:** {content} {verdict_emoji}")
-        else:
-            st.markdown(f"**{name}:** {content}")
+def chat_history_html(messages: List[ChatMessage], i18n: Optional[I18n] = None) -> str:
+    if not messages:
+        return ""
+
+    entries = tuple((msg.role, msg.content, msg.verdict) for msg in messages)
+    return _chat_history_html(
+        entries,
+        i18n("game_you") if i18n else "You",
+        i18n("game_dm") if i18n else "DM",
+    )
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _chat_history_html(
+    entries: Tuple[Tuple[str, str, str], ...],
+    you_name: str,
+    dm_name: str,
+) -> str:
+    names = {_PLAYER_ROLE[0]: you_name, _DM_ROLE[0]: dm_name}
+
+    # The wrapper tags sit on their own lines, separated by blank lines, so the
+    # message bodies stay markdown (bold verdicts etc.) rather than raw HTML.
+    # Bodies are escaped with quote=False: markup in them shows as text while
+    # markdown syntax is left alone.
+    parts = ['<div class="chat-container">']
+    append = parts.append
+    for role, content, verdict in entries:
+        css_role, avatar = _ROLE_MAP.get(role.lower(), _DM_ROLE)
+        badge = f" {render_verdict_badge(verdict)}" if verdict else ""
+        append(
+            f'<div class="chat-message chat-{css_role}">'
+            f'<span class="chat-avatar">{avatar}</span><div>'
+        )
+        append(f"**{names[css_role]}:** {html.escape(content, quote=False)}{badge}")
+        append("</div></div>")
+    append("</div>")
+
+    return "\n\n".join(parts)
 
 
 def render_verdict_badge(verdict: str) -> str:
-    verdict_lower = verdict.lower()
-    emoji = EMOJI_MAP.get(verdict_lower, "")
-    css_class = f"verdict-{verdict_lower.replace('_', '-')}"
-    
-    return f'<span class="verdict-badge {css_class}">{emoji} {verdict.upper()}</span>'
+    badge = _VERDICT_HTML.get(verdict)
+    if badge is None:
+        verdict_lower = verdict.lower()
+        badge = _VERDICT_HTML.get(verdict_lower) or _VERDICT_TEMPLATE.format(
+            css=verdict_lower.replace("_", "-"),
+            emoji=EMOJI_MAP.get(verdict_lower, ""),
+            label=verdict.upper(),
+        )
+    return badge
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _commands_panel_html(language: str) -> str:
+    i18n = I18n(language)
+    rows = "".join(
+        f"<p><code>/{command}</code> - {i18n(f'game_commands_{command}').split(' - ')[1]}</p>"
+        for command in ("hint", "status", "history", "quit", "help")
+    )
+    return f'<div class="command-list">{rows}</div>'
 
 
 def render_commands_panel(i18n: I18n) -> None:
     with st.expander(f"{EMOJI_MAP['info']} {i18n('game_commands_title')}", expanded=False):
-        st.markdown(
-            f"""
-            <div class="command-list">
-                <p><code>/hint</code> - {i18n('game_commands_hint').split(' - ')[1]}</p>
-                <p><code>/status</code> - {i18n('game_commands_status').split(' - ')[1]}</p>
-                <p><code>/history</code> - {i18n('game_commands_history').split(' - ')[1]}</p>
-                <p><code>/quit</code> - {i18n('game_commands_quit').split(' - ')[1]}</p>
-                <p><code>/help</code> - {i18n('game_commands_help').split(' - ')[1]}</p>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+        st.markdown(_commands_panel_html(i18n.language), unsafe_allow_html=True)
 
 
 def render_how_to_play(i18n: I18n) -> None:
@@ -170,19 +214,17 @@ def render_session_card(
     clicked = False
     
     with st.container():
-        cols = st.columns([3, 1, 1, 1, 2])
+        cols = st.columns([6, 2])
         
-        cols[0].markdown(f"**{puzzle_title}**")
-        cols[1].markdown(render_status_badge(state, i18n), unsafe_allow_html=True)
-        cols[2].markdown(f"{i18n('history_turns')}: {turn_count}")
-        
-        if score is not None:
-            cols[3].markdown(f"{EMOJI_MAP['star']} {score}")
-        else:
-            cols[3].markdown("-")
+        score_display = f"{EMOJI_MAP['star']} {score}" if score is not None else "-"
+        cols[0].markdown(
+            f"**{puzzle_title}** &nbsp; {render_status_badge(state, i18n)} &nbsp; "
+            f"{i18n('history_turns')}: {turn_count} &nbsp; {score_display}",
+            unsafe_allow_html=True,
+        )
         
         if on_click_key:
-            clicked = cols[4].button(
+            clicked = cols[1].button(
                 i18n("history_view_details"),
                 key=on_click_key,
                 use_container_width=True,
@@ -1,6 +1,7 @@
 """WebUI configuration constants and settings."""
 
-from dataclasses import dataclass, field
+import re
+from dataclasses import asdict, dataclass, field
 from typing import Dict, Any, List
 
 APP_NAME = "Echoes of Deceit"
@@ -9,6 +10,7 @@ APP_ICON = "🎭"
 
 DEFAULT_LANGUAGE = "en"
 DEFAULT_PLAYER_ID = "player"
+MAX_CHAT_MESSAGES = 500
 
 PAGE_CONFIG = {
     "page_title": APP_NAME,
@@ -44,7 +46,7 @@ EMOJI_MAP = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class UISettings:
     show_thinking: bool = False
     auto_scroll: bool = True
@@ -52,46 +54,50 @@ class UISettings:
     player_agent_mode: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerSettings:
     player_id: str = DEFAULT_PLAYER_ID
     display_name: str = ""
     language: str = DEFAULT_LANGUAGE
 
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     current_page: str = "home"
     current_session_id: str = ""
     current_puzzle_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChatMessage:
     role: str
     content: str
     verdict: str = ""
     timestamp: str = ""
     turn_index: int = 0
+    is_agent: bool = False
+
+    def __post_init__(self) -> None:
+        # Normalise once here so renderers can index the verdict tables directly
+        if self.verdict and not self.verdict.islower():
+            object.__setattr__(self, "verdict", self.verdict.lower())
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "role": self.role,
-            "content": self.content,
-            "verdict": self.verdict,
-            "timestamp": self.timestamp,
-            "turn_index": self.turn_index,
-        }
+        return asdict(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ChatMessage":
-        return cls(
-            role=data.get("role", ""),
-            content=data.get("content", ""),
-            verdict=data.get("verdict", ""),
-            timestamp=data.get("timestamp", ""),
-            turn_index=data.get("turn_index", 0),
-        )
+        return cls(**{key: data.get(key, default) for key, default in _CHAT_MESSAGE_DEFAULTS})
+
+
+_CHAT_MESSAGE_DEFAULTS = (
+    ("role", ""),
+    ("content", ""),
+    ("verdict", ""),
+    ("timestamp", ""),
+    ("turn_index", 0),
+    ("is_agent", False),
+)
 
 
 CSS_STYLES = """
@@ -114,6 +120,11 @@ CSS_STYLES = """
         margin: 0 0 0.5rem 0;
     }
     
+    .puzzle-meta {
+        font-size: 0.875rem;
+        color: #64748b;
+    }
+    
     .status-badge {
         display: inline-block;
         padding: 0.25rem 0.75rem;
@@ -150,6 +161,28 @@ CSS_STYLES = """
         border-radius: 10px;
     }
     
+    .chat-message {
+        display: flex;
+        gap: 0.75rem;
+        align-items: flex-start;
+        padding: 0.75rem;
+        margin-bottom: 0.5rem;
+        border-radius: 8px;
+    }
+    
+    .chat-user {
+        background-color: #eef2ff;
+    }
+    
+    .chat-assistant {
+        background-color: #ffffff;
+    }
+    
+    .chat-avatar {
+        font-size: 1.25rem;
+        line-height: 1.5rem;
+    }
+    
     .game-stats {
         display: flex;
         gap: 1rem;
@@ -227,3 +260,12 @@ CSS_STYLES = """
     }
 </style>
 """
+
+
+def _minify_css(css: str) -> str:
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};])\s*", r"\1", css)
+    return css.strip()
+
+
+CSS_STYLES_MIN = _minify_css(CSS_STYLES)
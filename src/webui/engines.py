@@ -0,0 +1,24 @@
+"""Process-wide GameEngine shared by every WebUI session."""
+
+from pathlib import Path
+
+import streamlit as st
+
+from game.engine import GameEngine
+
+
+@st.cache_resource(show_spinner=False)
+def load_game_engine(config_dir: str = "") -> GameEngine:
+    """Build the GameEngine once per process and config directory.
+
+    Streamlit returns the same instance to every session and rerun; call
+    ``load_game_engine.clear()`` to force a rebuild.
+    """
+    engine = GameEngine(config_dir=Path(config_dir) if config_dir else None)
+    
+    print("\n" + "=" * 50)
+    print("🎮 Game engine initialized successfully!")
+    print("🌐 WebUI is ready at: http://localhost:8501")
+    print("=" * 50 + "\n")
+    
+    return engine
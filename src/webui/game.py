@@ -5,18 +5,25 @@ from typing import Optional
 import streamlit as st
 
 from webui.i18n import I18n
-from webui.config import EMOJI_MAP
+from webui.config import EMOJI_MAP, ChatMessage
 from webui.components import (
     render_header,
     render_error,
     render_success,
     render_game_stats,
-    render_chat_message,
+    chat_history_html,
     render_commands_panel,
     render_how_to_play,
 )
 from webui import session_state as state
 from webui.async_utils import run_async
+from game.session_runner import GameSessionRunner
+from game.domain.entities import GameState
+
+
+def _on_back_home() -> None:
+    state.reset_game_state()
+    state.set_current_page("home")
 
 
 def render_game_page(i18n: I18n) -> Optional[str]:
@@ -36,16 +43,13 @@ def render_game_page(i18n: I18n) -> Optional[str]:
         render_error(i18n("error_init_required"))
         return None
     
+    ui_settings = state.get_ui_settings()
     runner = state.get_session_runner()
     if runner is None:
         try:
             session = engine.get_session(session_id)
             puzzle = engine.get_puzzle(puzzle_id)
             
-            ui_settings = state.get_ui_settings()
-            player_agent_mode = ui_settings.player_agent_mode
-            
-            from game.session_runner import GameSessionRunner
             runner = GameSessionRunner(
                 session=session,
                 puzzle=puzzle,
@@ -54,7 +58,7 @@ def render_game_page(i18n: I18n) -> Optional[str]:
                 session_store=engine.session_store,
                 llm_client=engine.model_registry.get_llm_client(),
                 agents_config=engine.agents_config,
-                player_agent_mode=player_agent_mode,
+                player_agent_mode=ui_settings.player_agent_mode,
                 dm_agent_mode=True,
             )
             state.set_session_runner(runner)
@@ -72,15 +76,19 @@ def render_game_page(i18n: I18n) -> Optional[str]:
     col1, col2 = st.columns([3, 1])
     
     with col1:
-        puzzle = engine.get_puzzle(puzzle_id)
+        puzzle = runner.puzzle
         st.markdown(f"### {EMOJI_MAP['puzzle']} {puzzle.title if puzzle.title else puzzle_id}")
         if puzzle.puzzle_statement:
             with st.expander(i18n("game_puzzle_story"), expanded=False):
                 st.markdown(puzzle.puzzle_statement)
     
     with col2:
-        if st.button(f"🏠 {i18n('nav_home')}", key="nav_home_btn", use_container_width=True):
-            return "back_home"
+        st.button(
+            f"🏠 {i18n('nav_home')}",
+            key="nav_home_btn",
+            use_container_width=True,
+            on_click=_on_back_home,
+        )
     
     st.markdown("---")
     
@@ -101,21 +109,9 @@ def render_game_page(i18n: I18n) -> Optional[str]:
     st.markdown("---")
     st.markdown(f"#### {EMOJI_MAP['game']} {i18n('game_chat_history')}")
     
-    messages = state.get_messages()
-    chat_container = st.container()
-    with chat_container:
-        for msg in messages:
-            render_chat_message(
-                role=msg["role"],
-                content=msg["content"],
-                verdict=msg.get("verdict"),
-                i18n=i18n,
-            )
+    _render_chat_history(i18n)
     
-    from game.domain.entities import GameState
     if session.state == GameState.IN_PROGRESS:
-        ui_settings = state.get_ui_settings()
-        
         if ui_settings.player_agent_mode:
             _render_agent_mode_controls(runner, i18n)
         else:
@@ -126,6 +122,18 @@ def render_game_page(i18n: I18n) -> Optional[str]:
     return None
 
 
+def _render_chat_history(i18n: I18n) -> None:
+    # Rebuild the markup only when messages or language changed since the last rerun
+    render_key = (state.get_messages_version(), i18n.language)
+    cached = st.session_state.get("chat_history_render")
+    if cached is None or cached[0] != render_key:
+        cached = (render_key, chat_history_html(state.get_messages(), i18n))
+        st.session_state.chat_history_render = cached
+    
+    if cached[1]:
+        st.markdown(cached[1], unsafe_allow_html=True)
+
+
 def _render_human_mode_controls(runner, i18n: I18n) -> None:
     with st.form(key="player_input_form", clear_on_submit=True):
         user_input = st.text_input(
@@ -206,7 +214,7 @@ def _process_player_input(runner, user_input: str, i18n: I18n) -> None:
         )
         
         if response.game_over:
-            state.set_success_message(i18n("game_over_message"))
+            st.toast(i18n("game_over_message"), icon=EMOJI_MAP["trophy"])
         
         st.rerun()
     except Exception as e:
@@ -219,24 +227,25 @@ def _run_agent_turn(runner, i18n: I18n) -> None:
         with st.spinner(i18n("game_agent_thinking")):
             response = run_async(runner.run_player_agent_turn())
         
+        turn_index = runner.session.turn_count
+        new_messages = []
         player_msg = response.metadata.get('player_message', '')
         if player_msg:
-            state.add_message(
-                "user",
-                player_msg,
-                turn_index=runner.session.turn_count,
-                is_agent=True,
+            new_messages.append(
+                ChatMessage(role="user", content=player_msg, turn_index=turn_index, is_agent=True)
+            )
+        new_messages.append(
+            ChatMessage(
+                role="assistant",
+                content=response.message,
+                verdict=response.verdict or "",
+                turn_index=turn_index,
             )
-        
-        state.add_message(
-            "assistant",
-            response.message,
-            verdict=response.verdict or "",
-            turn_index=runner.session.turn_count,
         )
+        state.add_messages(new_messages)
         
         if response.game_over:
-            state.set_success_message(i18n("game_over_message"))
+            st.toast(i18n("game_over_message"), icon=EMOJI_MAP["trophy"])
         
         st.rerun()
     except Exception as e:
@@ -245,8 +254,6 @@ def _run_agent_turn(runner, i18n: I18n) -> None:
 
 
 def _render_game_over(session, i18n: I18n) -> None:
-    from game.domain.entities import GameState
-    
     if session.state == GameState.COMPLETED:
         st.success(f"🎉 {i18n('game_completed')}")
     elif session.state == GameState.ABORTED:
@@ -1,6 +1,7 @@
 """Home page for puzzle selection and active sessions."""
 
 import asyncio
+import html
 from typing import Optional, List
 import streamlit as st
 
@@ -15,6 +16,12 @@ from webui.components import (
     render_status_badge,
 )
 from webui import session_state as state
+from webui.cache import cached_list_puzzles, cached_list_sessions
+from game.domain.entities import GameState
+
+_HR_SM = "<hr style='margin: 0.5rem 0; opacity: 0.2;'>"
+_HR_MD = "<hr style='margin: 0.75rem 0; opacity: 0.2;'>"
+_CAPTION_TEMPLATE = '<span class="puzzle-meta">{}</span>'
 
 
 def render_home_page(i18n: I18n) -> Optional[str]:
@@ -34,11 +41,15 @@ def render_home_page(i18n: I18n) -> Optional[str]:
     
     col1, col2 = st.columns([2, 1])
     
-    with col1:
-        _render_puzzle_selection(i18n)
-    
-    with col2:
-        _render_active_sessions(i18n)
+    st.session_state.home_full_run = True
+    try:
+        with col1:
+            _render_puzzle_selection(i18n)
+        
+        with col2:
+            _render_active_sessions(i18n)
+    finally:
+        st.session_state.home_full_run = False
     
     action = st.session_state.home_action
     if action:
@@ -49,19 +60,34 @@ def render_home_page(i18n: I18n) -> Optional[str]:
 
 
 def _on_start_puzzle(puzzle_id: str):
-    state.set_current_puzzle_id(puzzle_id)
+    # reset_game_state leaves current_puzzle_id untouched, so set it once
     state.reset_game_state()
     state.set_current_puzzle_id(puzzle_id)
     st.session_state.home_action = "start_game"
 
 
 def _on_continue_session(session_id: str, puzzle_id: str):
+    state.bump_state_version()
     state.set_current_session_id(session_id)
     state.set_current_puzzle_id(puzzle_id)
     st.session_state.home_action = "continue_game"
 
 
+def _truncate(text: str, limit: int = 100) -> str:
+    head = text[:limit]
+    return head + "..." if len(head) < len(text) else text
+
+
+def _escalate_pending_action() -> None:
+    # A button inside a fragment only reruns that fragment; promote the
+    # action it queued to a full app rerun so render_home_page can return it.
+    if st.session_state.get("home_action") and not st.session_state.get("home_full_run"):
+        st.rerun()
+
+
+@st.fragment
 def _render_puzzle_selection(i18n: I18n) -> None:
+    _escalate_pending_action()
     st.markdown(f"#### {EMOJI_MAP['puzzle']} {i18n('home_select_puzzle')}")
     
     engine = state.get_game_engine()
@@ -70,7 +96,7 @@ def _render_puzzle_selection(i18n: I18n) -> None:
         return
     
     try:
-        puzzles = engine.list_puzzles()
+        puzzles = cached_list_puzzles(engine)
     except Exception as e:
         render_error(f"{i18n('error_generic')}: {str(e)}")
         return
@@ -84,16 +110,18 @@ def _render_puzzle_selection(i18n: I18n) -> None:
             col1, col2 = st.columns([4, 1])
             
             with col1:
-                st.markdown(f"**{puzzle.title if puzzle.title else puzzle.id}**")
+                card = [f"**{html.escape(puzzle.title or puzzle.id)}**"]
                 if puzzle.description:
-                    st.caption(puzzle.description[:100] + "..." if len(puzzle.description) > 100 else puzzle.description)
+                    card.append(_CAPTION_TEMPLATE.format(html.escape(_truncate(puzzle.description))))
                 
-                meta_cols = st.columns(3)
+                meta = []
                 if puzzle.difficulty:
-                    meta_cols[0].caption(f"{i18n('home_puzzle_difficulty')}: {puzzle.difficulty}")
-                meta_cols[1].caption(f"{i18n('home_puzzle_language')}: {puzzle.language.upper()}")
+                    meta.append(f"{i18n('home_puzzle_difficulty')}: {puzzle.difficulty}")
+                meta.append(f"{i18n('home_puzzle_language')}: {puzzle.language.upper()}")
                 if puzzle.tags:
-                    meta_cols[2].caption(f"{i18n('home_puzzle_tags')}: {', '.join(puzzle.tags[:3])}")
+                    meta.append(f"{i18n('home_puzzle_tags')}: {', '.join(puzzle.tags[:3])}")
+                card.append(_CAPTION_TEMPLATE.format(html.escape(" · ".join(meta))))
+                st.markdown("  \n".join(card), unsafe_allow_html=True)
             
             with col2:
                 st.button(
@@ -104,10 +132,12 @@ def _render_puzzle_selection(i18n: I18n) -> None:
                     args=[puzzle.id],
                 )
             
-            st.markdown("<hr style='margin: 0.75rem 0; opacity: 0.2;'>", unsafe_allow_html=True)
+            st.markdown(_HR_MD, unsafe_allow_html=True)
 
 
+@st.fragment
 def _render_active_sessions(i18n: I18n) -> None:
+    _escalate_pending_action()
     st.markdown(f"#### {EMOJI_MAP['game']} {i18n('home_active_sessions')}")
     
     engine = state.get_game_engine()
@@ -115,9 +145,12 @@ def _render_active_sessions(i18n: I18n) -> None:
         return
     
     try:
-        from game.domain.entities import GameState
-        all_sessions = engine.list_sessions(player_id=state.get_player_id())
-        sessions = [s for s in all_sessions if s.state == GameState.IN_PROGRESS]
+        sessions = cached_list_sessions(
+            engine,
+            state.get_player_id(),
+            GameState.IN_PROGRESS.value,
+            state.get_state_version(),
+        )
     except Exception as e:
         render_error(str(e))
         return
@@ -126,18 +159,20 @@ def _render_active_sessions(i18n: I18n) -> None:
         render_empty_state(i18n("home_no_active_sessions"), icon="game")
         return
     
+    try:
+        puzzles_by_id = {p.id: p for p in cached_list_puzzles(engine)}
+    except Exception:
+        # Titles are cosmetic; label sessions by puzzle id instead
+        puzzles_by_id = {}
+    
     for session in sessions[:5]:
         with st.container():
-            try:
-                puzzle = engine.get_puzzle(session.puzzle_id)
-                puzzle_title = puzzle.title if puzzle.title else session.puzzle_id
-            except:
-                puzzle_title = session.puzzle_id
-            
-            st.markdown(f"**{puzzle_title}**")
+            puzzle = puzzles_by_id.get(session.puzzle_id)
+            puzzle_title = puzzle.title if puzzle and puzzle.title else session.puzzle_id
             
-            status_html = render_status_badge(session.state.value, i18n)
+            status_html = render_status_badge(session.state_value, i18n)
             st.markdown(
+                f"**{html.escape(puzzle_title)}**  \n"
                 f"{status_html} | {i18n('history_turns')}: {session.question_count}",
                 unsafe_allow_html=True,
             )
@@ -150,4 +185,4 @@ def _render_active_sessions(i18n: I18n) -> None:
                 args=[session.session_id, session.puzzle_id],
             )
             
-            st.markdown("<hr style='margin: 0.5rem 0; opacity: 0.2;'>", unsafe_allow_html=True)
+            st.markdown(_HR_SM, unsafe_allow_html=True)
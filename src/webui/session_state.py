@@ -1,6 +1,8 @@
 """Session state management for Streamlit WebUI."""
 
-from typing import Optional, List, Dict, Any
+from collections import deque
+from itertools import count
+from typing import Deque, Optional, List
 import streamlit as st
 
 from webui.config import (
@@ -10,32 +12,39 @@ from webui.config import (
     ChatMessage,
     DEFAULT_LANGUAGE,
     DEFAULT_PLAYER_ID,
+    MAX_CHAT_MESSAGES,
 )
 from webui.i18n import I18n
+from webui.engines import load_game_engine
+
+# Process-wide, so no two browser sessions ever hold the same state version
+# and the shared st.cache_data entries keyed on it stay per-session
+_state_versions = count(1)
 
 
 def init_session_state() -> None:
     if "initialized" not in st.session_state:
         st.session_state.initialized = True
         st.session_state.language = DEFAULT_LANGUAGE
-        st.session_state.i18n = I18n(DEFAULT_LANGUAGE)
         st.session_state.player_id = DEFAULT_PLAYER_ID
         st.session_state.display_name = ""
         st.session_state.current_page = "home"
         st.session_state.current_session_id = ""
         st.session_state.current_puzzle_id = ""
-        st.session_state.messages = []
-        st.session_state.game_engine = None
+        st.session_state.messages = deque(maxlen=MAX_CHAT_MESSAGES)
         st.session_state.session_runner = None
         st.session_state.ui_settings = UISettings()
         st.session_state.error_message = ""
-        st.session_state.success_message = ""
+        st.session_state.state_version = next(_state_versions)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_i18n_for(language: str) -> I18n:
+    return I18n(language)
 
 
 def get_i18n() -> I18n:
-    if "i18n" not in st.session_state:
-        st.session_state.i18n = I18n(get_language())
-    return st.session_state.i18n
+    return _get_i18n_for(get_language())
 
 
 def get_language() -> str:
@@ -43,8 +52,10 @@ def get_language() -> str:
 
 
 def set_language(language: str) -> None:
+    if st.session_state.get("language") == language:
+        return
     st.session_state.language = language
-    st.session_state.i18n = I18n(language)
+    bump_state_version()
 
 
 def get_player_id() -> str:
@@ -53,6 +64,7 @@ def get_player_id() -> str:
 
 def set_player_id(player_id: str) -> None:
     st.session_state.player_id = player_id
+    bump_state_version()
 
 
 def get_display_name() -> str:
@@ -87,34 +99,61 @@ def set_current_puzzle_id(puzzle_id: str) -> None:
     st.session_state.current_puzzle_id = puzzle_id
 
 
-def get_messages() -> List[Dict[str, Any]]:
-    return st.session_state.get("messages", [])
+def get_messages() -> Deque[ChatMessage]:
+    return st.session_state.get("messages", deque())
 
 
 def add_message(role: str, content: str, verdict: str = "", turn_index: int = 0, is_agent: bool = False) -> None:
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
+    add_messages([
+        ChatMessage(
+            role=role,
+            content=content,
+            verdict=verdict,
+            turn_index=turn_index,
+            is_agent=is_agent,
+        )
+    ])
+
+
+def add_messages(messages: List[ChatMessage]) -> None:
+    current = st.session_state.get("messages")
+    if not isinstance(current, deque):
+        # Sessions started before the ring buffer may still hold a plain list
+        st.session_state.messages = deque(current or (), maxlen=MAX_CHAT_MESSAGES)
     
-    message = {
-        "role": role,
-        "content": content,
-        "verdict": verdict,
-        "turn_index": turn_index,
-        "is_agent": is_agent,
-    }
-    st.session_state.messages.append(message)
+    st.session_state.messages.extend(messages)
+    _bump_messages_version()
 
 
 def clear_messages() -> None:
-    st.session_state.messages = []
+    st.session_state.messages = deque(maxlen=MAX_CHAT_MESSAGES)
+    _bump_messages_version()
 
 
-def get_game_engine():
-    return st.session_state.get("game_engine")
+def get_messages_version() -> int:
+    return st.session_state.get("messages_version", 0)
+
+
+def _bump_messages_version() -> None:
+    st.session_state.messages_version = get_messages_version() + 1
+
+
+def get_state_version() -> int:
+    return st.session_state.get("state_version", 0)
+
 
+def bump_state_version() -> None:
+    # Cached readers in webui.cache take this as an argument, so bumping it
+    # misses every cached entry for this session at once.
+    st.session_state.state_version = next(_state_versions)
 
-def set_game_engine(engine) -> None:
-    st.session_state.game_engine = engine
+
+def get_game_engine():
+    # The engine is a process-wide cache_resource singleton, not per-session state
+    try:
+        return load_game_engine()
+    except Exception:
+        return None
 
 
 def get_session_runner():
@@ -126,13 +165,12 @@ def set_session_runner(runner) -> None:
 
 
 def get_ui_settings() -> UISettings:
-    if "ui_settings" not in st.session_state:
-        st.session_state.ui_settings = UISettings()
-    return st.session_state.ui_settings
+    return st.session_state.setdefault("ui_settings", UISettings())
 
 
 def set_ui_settings(settings: UISettings) -> None:
     st.session_state.ui_settings = settings
+    bump_state_version()
 
 
 def get_error_message() -> str:
@@ -147,21 +185,9 @@ def clear_error_message() -> None:
     st.session_state.error_message = ""
 
 
-def get_success_message() -> str:
-    return st.session_state.get("success_message", "")
-
-
-def set_success_message(message: str) -> None:
-    st.session_state.success_message = message
-
-
-def clear_success_message() -> None:
-    st.session_state.success_message = ""
-
-
 def reset_game_state() -> None:
+    bump_state_version()
     st.session_state.current_session_id = ""
     st.session_state.session_runner = None
-    st.session_state.messages = []
+    clear_messages()
     clear_error_message()
-    clear_success_message()
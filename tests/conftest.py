@@ -7,4 +7,104 @@ src_path = str(Path(__file__).parent.parent / "src")
 if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
+from unittest.mock import MagicMock
+
 import pytest
+
+from game.cli.app import GameCLIApp
+from game.domain.entities import (
+    GameSession,
+    GameState,
+    Puzzle,
+    PuzzleConstraints,
+    PuzzleSummary,
+    SessionConfig,
+)
+from game.session_runner import GameResponse
+
+GAME_STARTED = GameResponse(message="Game started!")
+
+
+@pytest.fixture(scope="session")
+def sample_puzzle():
+    return Puzzle(
+        id="test_puzzle",
+        title="Test Puzzle",
+        description="A test puzzle",
+        puzzle_statement="A man walks into a bar...",
+        answer="He had hiccups.",
+        hints=["Think about why", "The gun wasn't harmful"],
+        constraints=PuzzleConstraints(max_hints=3),
+        tags=["classic", "test"],
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_puzzle_summary():
+    return PuzzleSummary(
+        id="test_puzzle",
+        title="Test Puzzle",
+        description="A test puzzle",
+        difficulty="easy",
+        tags=["classic", "test"],
+        language="en",
+    )
+
+
+@pytest.fixture(scope="session")
+def _base_session():
+    return GameSession(
+        session_id="test-session-123",
+        puzzle_id="test_puzzle",
+        player_ids=["test_player"],
+        kb_id="game_test_puzzle",
+        config=SessionConfig(),
+        state=GameState.IN_PROGRESS,
+    )
+
+
+@pytest.fixture
+def sample_session(_base_session):
+    # Tests reassign .state, so each one gets its own copy
+    return _base_session.model_copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def _status_template(_base_session):
+    return {
+        "session_id": _base_session.session_id,
+        "puzzle_id": _base_session.puzzle_id,
+        "puzzle_title": "Test Puzzle",
+        "state": _base_session.state.value,
+        "turn_count": 0,
+        "question_count": 0,
+        "hint_count": 0,
+        "max_hints": 3,
+        "score": None,
+        "created_at": _base_session.created_at.isoformat(),
+        "updated_at": _base_session.updated_at.isoformat(),
+        "completed_at": None,
+    }
+
+
+@pytest.fixture
+def status_dict(_status_template):
+    return _status_template.copy()
+
+
+@pytest.fixture
+def mock_app(sample_puzzle_summary, sample_session, status_dict):
+    app = MagicMock(spec_set=GameCLIApp)
+    app.list_puzzles.return_value = [sample_puzzle_summary]
+    app.create_session.return_value = sample_session
+    app.get_session.return_value = sample_session
+    app.list_sessions.return_value = [sample_session]
+    app.get_session_status.return_value = status_dict
+
+    mock_runner = MagicMock()
+    mock_runner.session = sample_session
+    mock_runner.is_active = False
+    mock_runner.start_game.return_value = GAME_STARTED
+    app.create_runner.return_value = mock_runner
+
+    return app
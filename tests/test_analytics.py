@@ -2,9 +2,6 @@
 
 import pytest
 import json
-import tempfile
-import shutil
-from pathlib import Path
 from datetime import datetime
 
 from game.memory.analytics import (
@@ -19,21 +16,25 @@ from game.memory.manager import MemoryManager
 from game.memory.file_store import FileMemoryStore
 
 
-@pytest.fixture
-def temp_dir():
-    dir_path = Path(tempfile.mkdtemp())
-    yield dir_path
-    shutil.rmtree(dir_path, ignore_errors=True)
+@pytest.fixture(scope="module")
+def temp_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("analytics_mod")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def analytics_service(temp_dir):
+    # Shared by the analysis tests, which never write to the export dir
     return AnalyticsService(export_dir=temp_dir / "analytics")
 
 
 @pytest.fixture
-def memory_manager(temp_dir):
-    store = FileMemoryStore(base_dir=temp_dir / "memory")
+def export_service(tmp_path):
+    return AnalyticsService(export_dir=tmp_path / "analytics")
+
+
+@pytest.fixture
+def memory_manager(tmp_path):
+    store = FileMemoryStore(base_dir=tmp_path / "memory")
     return MemoryManager(store=store)
 
 
@@ -92,11 +93,12 @@ class TestGlobalAnalytics:
 
 
 class TestAnalyticsService:
-    def test_categorize_session_length(self, analytics_service):
-        assert analytics_service._categorize_session_length(3) == "short"
-        assert analytics_service._categorize_session_length(10) == "medium"
-        assert analytics_service._categorize_session_length(20) == "long"
-        assert analytics_service._categorize_session_length(50) == "very_long"
+    @pytest.mark.parametrize(
+        "question_count,expected",
+        [(3, "short"), (10, "medium"), (20, "long"), (50, "very_long")],
+    )
+    def test_categorize_session_length(self, analytics_service, question_count, expected):
+        assert analytics_service._categorize_session_length(question_count) == expected
 
     def test_analyze_puzzle_no_data(self, analytics_service):
         result = analytics_service.analyze_puzzle("puzzle1")
@@ -182,37 +184,45 @@ class TestAnalyticsService:
         assert result.total_puzzles == 2
         assert result.overall_success_rate == pytest.approx(0.667, rel=0.01)
 
-    def test_export_to_json(self, analytics_service, temp_dir):
+    def test_export_to_json(self, export_service):
         data = {"test": "value", "count": 42}
 
-        filepath = analytics_service.export_to_json(data, "test_export")
+        filepath = export_service.export_to_json(data, "test_export")
 
         assert filepath.exists()
         with open(filepath) as f:
             loaded = json.load(f)
         assert loaded["test"] == "value"
 
-    def test_export_to_csv(self, analytics_service, temp_dir):
+    def test_export_to_json_matches_stdlib_format(self, export_service):
+        data = {"generated_at": datetime(2024, 1, 2, 3, 4, 5), "ids": {1: "a"}}
+
+        filepath = export_service.export_to_json(data, "format_export")
+
+        expected = json.dumps(data, indent=2, ensure_ascii=False, default=str)
+        assert filepath.read_text(encoding="utf-8") == expected
+
+    def test_export_to_csv(self, export_service):
         data = [
             {"id": 1, "name": "test1", "value": 10},
             {"id": 2, "name": "test2", "value": 20},
         ]
 
-        filepath = analytics_service.export_to_csv(data, "test_export")
+        filepath = export_service.export_to_csv(data, "test_export")
 
         assert filepath.exists()
         content = filepath.read_text()
         assert "id,name,value" in content
         assert "test1" in content
 
-    def test_export_to_csv_empty(self, analytics_service, temp_dir):
-        filepath = analytics_service.export_to_csv([], "empty_export")
+    def test_export_to_csv_empty(self, export_service):
+        filepath = export_service.export_to_csv([], "empty_export")
 
         assert filepath.exists()
         assert filepath.read_text() == ""
 
-    def test_generate_full_report_json(self, analytics_service, temp_dir):
-        files = analytics_service.generate_full_report(
+    def test_generate_full_report_json(self, export_service):
+        files = export_service.generate_full_report(
             puzzle_ids=["p1", "p2"],
             player_ids=["player1"],
             export_format="json",
@@ -221,8 +231,8 @@ class TestAnalyticsService:
         assert "report" in files
         assert files["report"].exists()
 
-    def test_generate_full_report_csv(self, analytics_service, temp_dir):
-        files = analytics_service.generate_full_report(
+    def test_generate_full_report_csv(self, export_service):
+        files = export_service.generate_full_report(
             puzzle_ids=["p1"],
             player_ids=["player1"],
             export_format="csv",
@@ -283,8 +293,8 @@ class TestSessionEventAggregator:
         assert result["question_count"] == 2
         assert result["success"] is True
 
-    def test_aggregate_from_event_logs(self, temp_dir):
-        events_dir = temp_dir / "events"
+    def test_aggregate_from_event_logs(self, tmp_path):
+        events_dir = tmp_path / "events"
         events_dir.mkdir()
 
         events = [
@@ -305,8 +315,8 @@ class TestSessionEventAggregator:
         assert results[0]["question_count"] == 1
         assert results[0]["hypothesis_count"] == 1
 
-    def test_aggregate_from_event_logs_empty_dir(self, temp_dir):
-        events_dir = temp_dir / "empty_events"
+    def test_aggregate_from_event_logs_empty_dir(self, tmp_path):
+        events_dir = tmp_path / "empty_events"
         events_dir.mkdir()
 
         aggregator = SessionEventAggregator()
@@ -314,8 +324,8 @@ class TestSessionEventAggregator:
 
         assert results == []
 
-    def test_aggregate_from_event_logs_nonexistent(self, temp_dir):
+    def test_aggregate_from_event_logs_nonexistent(self, tmp_path):
         aggregator = SessionEventAggregator()
-        results = aggregator.aggregate_from_event_logs(temp_dir / "nonexistent")
+        results = aggregator.aggregate_from_event_logs(tmp_path / "nonexistent")
 
         assert results == []
@@ -1,14 +1,11 @@
 """Tests for CLI commands and application."""
 
-import tempfile
-from datetime import datetime
-from pathlib import Path
+import json
 from typing import List
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
-from game.cli.app import GameCLIApp
 from game.cli.commands import (
     CommandResult,
     list_puzzles,
@@ -19,86 +16,10 @@ from game.cli.commands import (
     resume_session,
 )
 from game.cli.formatters import TextFormatter, JsonFormatter, get_formatter
-from game.domain.entities import (
-    GameSession,
-    GameState,
-    Puzzle,
-    PuzzleSummary,
-    PuzzleConstraints,
-    SessionConfig,
-)
+from game.domain.entities import GameState
 from game.session_runner import GameResponse
 
 
-@pytest.fixture
-def sample_puzzle():
-    return Puzzle(
-        id="test_puzzle",
-        title="Test Puzzle",
-        description="A test puzzle",
-        puzzle_statement="A man walks into a bar...",
-        answer="He had hiccups.",
-        hints=["Think about why", "The gun wasn't harmful"],
-        constraints=PuzzleConstraints(max_hints=3),
-        tags=["classic", "test"],
-    )
-
-
-@pytest.fixture
-def sample_puzzle_summary():
-    return PuzzleSummary(
-        id="test_puzzle",
-        title="Test Puzzle",
-        description="A test puzzle",
-        difficulty="easy",
-        tags=["classic", "test"],
-        language="en",
-    )
-
-
-@pytest.fixture
-def sample_session(sample_puzzle):
-    return GameSession(
-        session_id="test-session-123",
-        puzzle_id=sample_puzzle.id,
-        player_ids=["test_player"],
-        kb_id="game_test_puzzle",
-        config=SessionConfig(),
-        state=GameState.IN_PROGRESS,
-    )
-
-
-@pytest.fixture
-def mock_app(sample_puzzle, sample_puzzle_summary, sample_session):
-    app = MagicMock(spec=GameCLIApp)
-    app.list_puzzles.return_value = [sample_puzzle_summary]
-    app.create_session = AsyncMock(return_value=sample_session)
-    app.get_session.return_value = sample_session
-    app.list_sessions.return_value = [sample_session]
-    app.get_session_status.return_value = {
-        "session_id": sample_session.session_id,
-        "puzzle_id": sample_session.puzzle_id,
-        "puzzle_title": "Test Puzzle",
-        "state": sample_session.state.value,
-        "turn_count": 0,
-        "question_count": 0,
-        "hint_count": 0,
-        "max_hints": 3,
-        "score": None,
-        "created_at": sample_session.created_at.isoformat(),
-        "updated_at": sample_session.updated_at.isoformat(),
-        "completed_at": None,
-    }
-
-    mock_runner = MagicMock()
-    mock_runner.session = sample_session
-    mock_runner.is_active = False
-    mock_runner.start_game.return_value = GameResponse(message="Game started!")
-    app.create_runner.return_value = mock_runner
-
-    return app
-
-
 class TestListPuzzlesCommand:
     def test_list_puzzles_success(self, mock_app, sample_puzzle_summary):
         result = list_puzzles(mock_app)
@@ -126,7 +47,6 @@ class TestListPuzzlesCommand:
 
 
 class TestStartSessionCommand:
-    @pytest.mark.asyncio
     async def test_start_session_success(self, mock_app, sample_session):
         result = await start_session(mock_app, "test_puzzle", "test_player")
 
@@ -136,7 +56,6 @@ class TestStartSessionCommand:
         assert result.data["player"] == "test_player"
         mock_app.create_session.assert_called_once_with("test_puzzle", "test_player", None)
 
-    @pytest.mark.asyncio
     async def test_start_session_puzzle_not_found(self, mock_app):
         mock_app.create_session.side_effect = ValueError("Puzzle not found: invalid_puzzle")
         result = await start_session(mock_app, "invalid_puzzle", "test_player")
@@ -144,7 +63,6 @@ class TestStartSessionCommand:
         assert result.success is False
         assert "Puzzle not found" in result.error
 
-    @pytest.mark.asyncio
     async def test_start_session_with_options(self, mock_app, sample_session):
         options = {"difficulty": "hard"}
         result = await start_session(mock_app, "test_puzzle", "test_player", options)
@@ -201,10 +119,9 @@ class TestListSessionsCommand:
 
 
 class TestPlaySessionCommand:
-    @pytest.mark.asyncio
     async def test_play_new_session(self, mock_app, sample_session):
         sample_session.state = GameState.LOBBY
-        inputs = iter([""])
+        input_mock = MagicMock(side_effect=[""])
         outputs: List[str] = []
 
         mock_runner = mock_app.create_runner.return_value
@@ -215,31 +132,22 @@ class TestPlaySessionCommand:
         result = await play_session(
             mock_app,
             sample_session,
-            lambda: next(inputs),
-            lambda msg: outputs.append(msg),
+            input_mock,
+            outputs.append,
         )
 
         assert result.success is True
         mock_runner.start_game.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_play_session_with_interrupt(self, mock_app, sample_session):
         sample_session.state = GameState.IN_PROGRESS
         mock_runner = mock_app.create_runner.return_value
         mock_runner.is_active = True
 
-        call_count = 0
-        def raise_interrupt():
-            nonlocal call_count
-            call_count += 1
-            if call_count > 1:
-                raise KeyboardInterrupt()
-            return ""
-
         result = await play_session(
             mock_app,
             sample_session,
-            raise_interrupt,
+            MagicMock(side_effect=["", KeyboardInterrupt()]),
             lambda msg: None,
         )
 
@@ -249,7 +157,6 @@ class TestPlaySessionCommand:
 
 
 class TestResumeSessionCommand:
-    @pytest.mark.asyncio
     async def test_resume_success(self, mock_app, sample_session):
         sample_session.state = GameState.IN_PROGRESS
         mock_runner = mock_app.create_runner.return_value
@@ -261,13 +168,12 @@ class TestResumeSessionCommand:
             mock_app,
             sample_session.session_id,
             lambda: "",
-            lambda msg: outputs.append(msg),
+            outputs.append,
         )
 
         assert result.success is True
         assert any("resumed" in o.lower() for o in outputs)
 
-    @pytest.mark.asyncio
     async def test_resume_not_found(self, mock_app):
         mock_app.get_session.side_effect = ValueError("Not found")
 
@@ -281,7 +187,6 @@ class TestResumeSessionCommand:
         assert result.success is False
         assert "not found" in result.message.lower()
 
-    @pytest.mark.asyncio
     async def test_resume_completed_session(self, mock_app, sample_session):
         sample_session.state = GameState.COMPLETED
         mock_app.get_session.return_value = sample_session
@@ -380,7 +285,6 @@ class TestJsonFormatter:
 
         output = formatter.format_puzzles(puzzles)
 
-        import json
         data = json.loads(output)
         assert "puzzles" in data
         assert len(data["puzzles"]) == 1
@@ -396,7 +300,6 @@ class TestJsonFormatter:
 
         output = formatter.format_result(result)
 
-        import json
         data = json.loads(output)
         assert data["success"] is True
         assert data["message"] == "Operation completed"
@@ -404,13 +307,12 @@ class TestJsonFormatter:
 
 
 class TestGetFormatter:
-    def test_get_text_formatter(self):
-        formatter = get_formatter(json_mode=False)
-        assert isinstance(formatter, TextFormatter)
-
-    def test_get_json_formatter(self):
-        formatter = get_formatter(json_mode=True)
-        assert isinstance(formatter, JsonFormatter)
+    @pytest.mark.parametrize(
+        "json_mode,formatter_cls",
+        [(False, TextFormatter), (True, JsonFormatter)],
+    )
+    def test_get_formatter(self, json_mode, formatter_cls):
+        assert isinstance(get_formatter(json_mode=json_mode), formatter_cls)
 
 
 class TestCommandResult:
@@ -310,6 +310,22 @@ class TestConfigLoader:
             
             assert config1 is not config2
 
+    def test_config_force_reload_picks_up_edits(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_dir = Path(tmpdir)
+            game_yaml = config_dir / "game.yaml"
+            game_yaml.write_text("", encoding="utf-8")
+            
+            loader = ConfigLoader(config_dir)
+            assert loader.load_game_config().rag.default_provider == "lightrag"
+            
+            game_yaml.write_text(
+                yaml.safe_dump({"rag": {"default_provider": "minirag"}}), encoding="utf-8"
+            )
+            config = loader.load_game_config(force_reload=True)
+            
+            assert config.rag.default_provider == "minirag"
+
     def test_missing_config_file_uses_defaults(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             config_dir = Path(tmpdir)
@@ -1,5 +1,7 @@
 """Tests for domain entities."""
 
+import json
+import sys
 import uuid
 from datetime import datetime
 
@@ -197,6 +199,20 @@ class TestSessionEvent:
         restored = SessionEvent.model_validate(data)
         assert restored.role == AgentRole.DM
 
+    def test_from_trusted_interns_tags(self):
+        event = SessionEvent(
+            session_id="session_1",
+            turn_index=0,
+            role=AgentRole.PLAYER,
+            message="Is it a person?",
+            tags=["question"],
+        )
+        data = json.loads(json.dumps(event.model_dump(mode="json")))
+
+        restored = SessionEvent.from_trusted(data)
+        assert restored.role is AgentRole.PLAYER
+        assert restored.tags[0] is sys.intern("question")
+
 
 class TestSessionConfig:
     def test_default_config(self):
@@ -332,6 +348,25 @@ class TestGameSession:
         # question_count only counts questions
         assert session.question_count == 2
 
+    def test_question_count_survives_validation(self):
+        session = GameSession(puzzle_id="puzzle_1")
+        session.add_event(AgentRole.PLAYER, "Is it a person?", tags=["question"])
+        session.add_event(AgentRole.DM, "Yes.", tags=["answer"])
+
+        restored = GameSession.model_validate(session.model_dump(mode="json"))
+        assert restored.question_count == 1
+
+        restored.append_event(
+            SessionEvent(
+                session_id=restored.session_id,
+                turn_index=restored.turn_count,
+                role=AgentRole.PLAYER,
+                message="Is the person alive?",
+                tags=["question"],
+            )
+        )
+        assert restored.question_count == 2
+
     def test_get_recent_events(self):
         session = GameSession(puzzle_id="puzzle_1")
 
@@ -374,3 +409,30 @@ class TestGameSession:
         assert restored.session_id == session.session_id
         assert restored.state == GameState.IN_PROGRESS
         assert restored.turn_count == 1
+
+    def test_session_from_trusted(self):
+        session = GameSession(
+            puzzle_id="puzzle_1",
+            player_ids=["player_1"],
+        )
+        session.start()
+        session.add_event(AgentRole.PLAYER, "Is it a dog?", tags=["question"])
+
+        # What the session store hands back: enums as strings, datetimes decoded
+        data = session.model_dump()
+        data["state"] = "in_progress"
+        data["turn_history"][0]["role"] = "player"
+
+        restored = GameSession.from_trusted(data)
+        assert restored.state is GameState.IN_PROGRESS
+        assert restored.turn_history[0].role is AgentRole.PLAYER
+        assert restored.question_count == 1
+        assert restored == session
+
+    def test_session_from_trusted_applies_defaults(self):
+        session = GameSession(puzzle_id="puzzle_1")
+        data = session.model_dump()
+        del data["state"]
+
+        restored = GameSession.from_trusted(data)
+        assert restored.state is GameSession.model_validate(data).state
@@ -1,11 +1,15 @@
 """Tests for FileMemoryStore."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from datetime import datetime
 from pathlib import Path
 import tempfile
 import shutil
 
-from game.memory.file_store import FileMemoryStore
+from game.memory.file_store import _SEARCH_CACHE_NAMESPACES, FileMemoryStore
 from game.memory.entities import MemoryDocument
 
 
@@ -72,6 +76,37 @@ class TestFileMemoryStorePutGet:
         assert updated.created_at == original_created
         assert updated.updated_at >= original_created
 
+    def test_created_at_across_instances_and_delete(self, store, temp_dir):
+        first = store.put("test", "doc1", {"v": 1})
+
+        reopened = FileMemoryStore(base_dir=temp_dir)
+        assert reopened.put("test", "doc1", {"v": 2}).created_at == first.created_at
+
+        reopened.delete("test", "doc1")
+        recreated = reopened.put("test", "doc1", {"v": 3})
+        assert recreated.created_at > first.created_at
+
+    def test_created_at_after_external_delete_and_rewrite(self, store, temp_dir):
+        store.put("test", "doc1", {"v": 1})
+
+        other = FileMemoryStore(base_dir=temp_dir)
+        other.delete("test", "doc1")
+        recreated = other.put("test", "doc1", {"v": 2})
+
+        assert store.put("test", "doc1", {"v": 3}).created_at == recreated.created_at
+
+    def test_round_trips_nested_datetimes(self, store):
+        stored = store.put(
+            "test",
+            "doc1",
+            {"events": [{"at": datetime(2024, 1, 2, 3, 4, 5), "note": "plain"}]},
+        )
+
+        retrieved = store.get("test", "doc1")
+        assert retrieved.created_at == stored.created_at
+        assert retrieved.value["events"][0]["at"] == datetime(2024, 1, 2, 3, 4, 5)
+        assert retrieved.value["events"][0]["note"] == "plain"
+
 
 class TestFileMemoryStoreDelete:
     def test_delete_existing(self, store):
@@ -109,6 +144,38 @@ class TestFileMemoryStoreSearch:
         assert len(results) > 0
         assert results[0].key in ["doc1", "doc3"]
 
+    def test_search_sees_updates_and_deletes(self, store):
+        store.put("ns", "doc1", {"text": "pizza"})
+        store.put("ns", "doc2", {"text": "hiking"})
+        assert store.search("ns", query="pizza")[0].key == "doc1"
+
+        store.put("ns", "doc2", {"text": "pizza night, with friends"})
+        store.delete("ns", "doc1")
+        results = store.search("ns", query="pizza")
+
+        assert [r.key for r in results] == ["doc2"]
+        results[0].document.value["text"] = "mutated"
+        assert store.search("ns", query="pizza")[0].score == 1.0
+
+    def test_search_sees_same_size_rewrite_with_unchanged_mtime(self, store, temp_dir):
+        store.put("ns", "doc1", {"food": "pizza"})
+        doc_file = temp_dir / "ns" / "doc1.json"
+        stat = doc_file.stat()
+        assert store.search("ns")[0].value == {"food": "pizza"}
+
+        store.put("ns", "doc1", {"food": "pasta"})
+        os.utime(doc_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert store.search("ns")[0].value == {"food": "pasta"}
+
+    def test_search_cache_is_bounded(self, store):
+        for i in range(_SEARCH_CACHE_NAMESPACES + 8):
+            store.put(f"ns{i}", "doc", {"n": i})
+            store.search(f"ns{i}")
+
+        assert len(store._search_cache) == _SEARCH_CACHE_NAMESPACES
+        assert store.search("ns0")[0].value == {"n": 0}
+
     def test_search_with_limit(self, store):
         for i in range(10):
             store.put("ns", f"doc{i}", {"index": i})
@@ -162,6 +229,21 @@ class TestFileMemoryStoreBatch:
         assert store.get("batch", "d2") is not None
         assert store.get("batch", "d3") is not None
 
+    def test_batch_put_preserves_created_at(self, store, temp_dir):
+        original = store.put("batch", "d1", {"n": 1})
+
+        reopened = FileMemoryStore(base_dir=temp_dir)
+        results = reopened.batch_put(
+            [
+                MemoryDocument(namespace="batch", key="d1", value={"n": 2}),
+                MemoryDocument(namespace="batch", key="d2", value={"n": 3}),
+            ]
+        )
+
+        assert results[0].created_at == original.created_at
+        assert results[0].value == {"n": 2}
+        assert results[1].created_at >= original.created_at
+
     def test_batch_get(self, store):
         store.put("ns", "k1", {"v": 1})
         store.put("ns", "k2", {"v": 2})
@@ -173,6 +255,16 @@ class TestFileMemoryStoreBatch:
         assert results[1] is not None
         assert results[2] is None
 
+    def test_batch_get_preserves_order_across_namespaces(self, store):
+        store.put("ns_a", "k", {"v": "a"})
+        store.put(("ns", "b"), "k", {"v": "b"})
+
+        results = store.batch_get(
+            [("ns:b", "k"), ("missing_ns", "k"), ("ns_a", "k"), ("ns:b", "k")]
+        )
+
+        assert [r.value["v"] if r else None for r in results] == ["b", None, "a", "b"]
+
 
 class TestFileMemoryStoreClear:
     def test_clear_namespace(self, store):
@@ -207,3 +299,31 @@ class TestFileMemoryStoreAppend:
 
         assert doc1.key == "event_1"
         assert doc2.key == "event_2"
+
+    def test_append_from_two_stores_never_overwrites(self, store, temp_dir):
+        other = FileMemoryStore(base_dir=temp_dir)
+
+        assert store.append_to_namespace("events", {"by": "a"}).key == "item_1"
+        assert other.append_to_namespace("events", {"by": "b"}).key == "item_2"
+        assert store.append_to_namespace("events", {"by": "a"}).key == "item_3"
+
+        assert store.get("events", "item_2").value == {"by": "b"}
+
+    def test_append_from_threads(self, store):
+        def append_many(worker):
+            for i in range(25):
+                store.append_to_namespace("events", {"worker": worker, "i": i})
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(append_many, range(4)))
+
+        assert len(store.list_keys("events")) == 100
+
+    def test_append_after_direct_put_and_clear(self, store):
+        store.append_to_namespace("events", {"data": 1})
+        store.put("events", "item_5", {"data": 5})
+
+        assert store.append_to_namespace("events", {"data": 6}).key == "item_6"
+
+        store.clear_namespace("events")
+        assert store.append_to_namespace("events", {"data": 1}).key == "item_1"